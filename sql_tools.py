@@ -0,0 +1,724 @@
+import re
+import textwrap
+from typing import Match, Dict, List, Tuple
+
+
+def align_create_table(sql_text: str, wrap_comment_width: int, case_sensitive: bool) -> str:
+    flags = re.S | re.X | (0 if case_sensitive else re.I)
+
+    sql_text = _align_all_comments(sql_text, wrap_comment_width, flags)
+
+    sql_text = _align_create_table_columns(sql_text, flags)
+
+    sql_text = re.sub(
+        r'(\);\s*)\n+(\s*COMMENT)',
+        r'\1\n\2',
+        sql_text,
+        flags=re.S | re.I
+    )
+
+    return sql_text
+
+
+def _align_create_table_columns(sql_text: str, flags: int) -> str:
+    create_pat = re.compile(r"""
+        (CREATE\s+TABLE\s+(?:
+            "?\w+"?\.)?       
+            "?\w+"?            
+            \s*\()             
+        (.*?)                  
+        (\s*\)\s*;)            
+    """, flags=flags)
+
+    def align_columns_replacer(match: Match) -> str:
+        raw = match.group(2)
+        chunks = [seg.strip() for seg in re.split(r',(?=(?:[^"]*"[^"]*")*[^"]*$)', raw) if seg.strip()]
+
+        parsed_rows = []
+        for chunk in chunks:
+            m = re.match(r'("([^"]+)"\s*)(\S+)(.*)', chunk)
+            if m:
+                full_col_part, col_name, type_, rest = m.groups()
+                parsed_rows.append({'full_col': full_col_part.strip(), 'type_': type_, 'rest': rest.strip()})
+            else:
+                parsed_rows.append({'full_col': '', 'type_': '', 'rest': chunk.strip()})
+
+        valid_rows = [r for r in parsed_rows if r['full_col']]
+
+        max_full_col_len = max((len(r['full_col']) for r in valid_rows), default=0)
+        max_type_len = max((len(r['type_']) for r in valid_rows), default=0)
+
+        aligned = []
+        for row in parsed_rows:
+            if row['full_col']:
+                line = f'    {row["full_col"].ljust(max_full_col_len)} {row["type_"].ljust(max_type_len)} {row["rest"]}'.rstrip()
+            else:
+                line = f'    {row["rest"]}'
+            aligned.append(line)
+
+        return match.group(1) + "\n" + ",\n".join(aligned) + match.group(3)
+
+    return create_pat.sub(align_columns_replacer, sql_text)
+
+
+def _align_all_comments(sql_text: str, wrap_comment_width: int, flags: int) -> str:
+    all_comments_pat = re.compile(r"""
+        (COMMENT\s+ON\s+(?:TABLE|COLUMN)\s+[^;]+?)\s+IS\s+'([^']*)';
+    """, flags=flags | re.DOTALL)
+
+    all_comment_parts = [m.group(1).strip() for m in all_comments_pat.finditer(sql_text)]
+
+    if not all_comment_parts:
+        return sql_text
+
+    max_len = max(len(part) for part in all_comment_parts) + 2
+
+    def repl_comm(m: Match) -> str:
+        part_before_is, body = m.group(1), m.group(2)
+
+        if '\n' not in body:
+            body = "\n".join(textwrap.wrap(
+                body, width=wrap_comment_width,
+                break_long_words=False, break_on_hyphens=False))
+
+        return f"{part_before_is.ljust(max_len)} IS '{body}';"
+
+    return all_comments_pat.sub(repl_comm, sql_text)
+
+
+def _clean_comment(comment_block: str) -> str:
+    if not comment_block:
+        return ""
+
+    clean_text = comment_block.strip().lstrip('/*').lstrip('*').rstrip('*/').strip()
+
+    lines = clean_text.split('\n')
+    for line in lines:
+        line = line.strip().lstrip('*').strip()
+        if line and not line.startswith('@'):
+            return line
+    return ""
+
+
+def _sql_literal(text: str) -> str:
+    return text.replace("'", "''")
+
+
+def camel_to_snake(name: str) -> str:
+    s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
+    return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
+
+
+def java_type_to_sql(java_type: str, field_name: str = "", db_type: str = "PostgreSQL") -> Tuple[str, str, str]:
+    if db_type == "PostgreSQL":
+        type_mapping = {
+            'String': 'varchar(255)',
+            'Integer': 'int4',
+            'int': 'int4',
+            'Long': 'int8',
+            'long': 'int8',
+            'Double': 'numeric(10,2)',
+            'double': 'numeric(10,2)',
+            'Float': 'float4',
+            'float': 'float4',
+            'Boolean': 'int2',
+            'boolean': 'int2',
+            'Date': 'timestamp(6)',
+            'LocalDate': 'date',
+            'LocalDateTime': 'timestamp(6)',
+            'LocalTime': 'time',
+            'Timestamp': 'timestamp(6)',
+            'BigDecimal': 'numeric(10,2)',
+            'byte[]': 'bytea',
+            'Byte[]': 'bytea'
+        }
+    else:
+        type_mapping = {
+            'String': 'VARCHAR(255)',
+            'Integer': 'INT',
+            'int': 'INT',
+            'Long': 'BIGINT',
+            'long': 'BIGINT',
+            'Double': 'DECIMAL(10,2)',
+            'double': 'DECIMAL(10,2)',
+            'Float': 'FLOAT',
+            'float': 'FLOAT',
+            'Boolean': 'TINYINT(1)',
+            'boolean': 'TINYINT(1)',
+            'Date': 'DATETIME',
+            'LocalDate': 'DATE',
+            'LocalDateTime': 'DATETIME',
+            'LocalTime': 'TIME',
+            'Timestamp': 'TIMESTAMP',
+            'BigDecimal': 'DECIMAL(10,2)',
+            'byte[]': 'BLOB',
+            'Byte[]': 'BLOB'
+        }
+
+    java_type = re.sub(r'<.*?>', '', java_type).strip()
+
+    sql_type = type_mapping.get(java_type, 'varchar(255)' if db_type == "PostgreSQL" else 'VARCHAR(255)')
+    constraints = ""
+    default_value = ""
+
+    field_lower = field_name.lower()
+
+    if field_lower in ['id', 'uid']:
+        if db_type == "PostgreSQL":
+            sql_type = 'int8'
+            constraints = 'NOT NULL PRIMARY KEY'
+        else:
+            sql_type = 'BIGINT'
+            constraints = 'AUTO_INCREMENT PRIMARY KEY'
+    elif field_lower == 'tenant_id':
+        if db_type == "PostgreSQL":
+            sql_type = 'int8'
+        constraints = 'NOT NULL'
+        default_value = 'DEFAULT 0'
+    elif 'email' in field_lower:
+        sql_type = 'varchar(100)' if db_type == "PostgreSQL" else 'VARCHAR(100)'
+    elif 'phone' in field_lower:
+        sql_type = 'varchar(20)' if db_type == "PostgreSQL" else 'VARCHAR(20)'
+    elif 'password' in field_lower:
+        sql_type = 'varchar(128)' if db_type == "PostgreSQL" else 'VARCHAR(128)'
+    elif field_lower in ['name', 'code']:
+        if field_lower == 'code':
+            sql_type = 'varchar(100)' if db_type == "PostgreSQL" else 'VARCHAR(100)'
+        constraints = 'NOT NULL'
+    elif field_lower == 'description':
+        sql_type = 'varchar(500)' if db_type == "PostgreSQL" else 'VARCHAR(500)'
+    elif field_lower in ['status', 'sort']:
+        if db_type == "PostgreSQL":
+            sql_type = 'int4'
+        constraints = 'NOT NULL'
+        default_value = 'DEFAULT 0'
+    elif field_lower in ['creator', 'updater']:
+        sql_type = 'varchar(64)' if db_type == "PostgreSQL" else 'VARCHAR(64)'
+    elif field_lower in ['create_time', 'update_time']:
+        if db_type == "PostgreSQL":
+            sql_type = 'timestamp(6)'
+        constraints = 'NOT NULL'
+        default_value = 'DEFAULT CURRENT_TIMESTAMP'
+    elif field_lower == 'deleted':
+        if db_type == "PostgreSQL":
+            sql_type = 'int2'
+        constraints = 'NOT NULL'
+        default_value = 'DEFAULT 0'
+
+    return sql_type, constraints, default_value
+
+
+BASE_DO_FIELDS = [
+    ('tenantId', 'Long', 'Tenant ID'),
+    ('creator', 'String', 'Creator'),
+    ('createTime', 'LocalDateTime', 'Create Time'),
+    ('updater', 'String', 'Updater'),
+    ('updateTime', 'LocalDateTime', 'Update Time'),
+    ('deleted', 'Boolean', 'Logical Delete')
+]
+
+
+def parse_java_class(java_code: str) -> Dict:
+    result = {
+        'class_name': '',
+        'fields': [],
+        'class_comment': '',
+        'table_name': '',
+        'key_sequence': ''
+    }
+
+    class_match = re.search(r'(?:public\s+)?class\s+(\w+)', java_code)
+    if class_match:
+        result['class_name'] = class_match.group(1)
+
+    table_name_match = re.search(r'@TableName\s*\(\s*"([^"]+)"\s*\)', java_code)
+    if table_name_match:
+        result['table_name'] = table_name_match.group(1)
+
+    key_sequence_match = re.search(r'@KeySequence\s*\(\s*"([^"]+)"\s*\)', java_code)
+    if key_sequence_match:
+        result['key_sequence'] = key_sequence_match.group(1)
+
+    class_comment_match = re.search(r'/\*\*(.*?)\*/\s*(?:@\w+[^\n]*\n\s*)*public\s+class', java_code, re.DOTALL)
+    if class_comment_match:
+        raw_comment = class_comment_match.group(1)
+        comment = _clean_comment(raw_comment)
+        result['class_comment'] = comment
+
+    field_pattern = re.compile(r'''
+        (\s*/{1,2}\*[\s\S]*?\*/\s*)? 
+        (?:@\w+[^\n]*\n\s*)* 
+        (?:private|public|protected)?\s*
+        (?:static\s+)?(?:final\s+)?
+        (\w+(?:<[^>]+>)?)\s+
+        (\w+)
+        (?:\s*=\s*[^;]+)?
+        \s*;
+    ''', re.VERBOSE | re.MULTILINE | re.DOTALL)
+
+    for match in field_pattern.finditer(java_code):
+        comment_block = match.group(1)
+        field_type = match.group(2).strip()
+        field_name = match.group(3).strip()
+
+        comment = _clean_comment(comment_block) if comment_block else ''
+
+        result['fields'].append({
+            'name': field_name,
+            'type': field_type,
+            'comment': comment
+        })
+    return result
+
+
+def _resolve_table_name(parsed: Dict, schema_name: str) -> Tuple[str, str]:
+    table_name = parsed['table_name'] if parsed['table_name'] else camel_to_snake(parsed['class_name'])
+    table_schema, _, table_name = table_name.rpartition('.')
+    return table_schema or schema_name, table_name
+
+
+def java_do_to_sql(java_code: str, schema_name: str = "public",
+                   add_drop_table: bool = True, add_base_do_fields: bool = True,
+                   add_sequence: bool = True, use_camel_to_snake: bool = True,
+                   db_type: str = "PostgreSQL") -> str:
+    parsed = parse_java_class(java_code)
+
+    if not parsed['class_name']:
+        return "-- Error: Could not parse Java class"
+
+    schema_name, table_name = _resolve_table_name(parsed, schema_name)
+    full_table_name = f'"{schema_name}"."{table_name}"' if db_type == "PostgreSQL" else f"`{table_name}`"
+
+    sql_lines = []
+
+    if add_drop_table:
+        sql_lines.append("-- ------------------------------")
+        sql_lines.append(f"-- Table structure for {table_name}")
+        sql_lines.append("-- ------------------------------")
+        sql_lines.append(f'DROP TABLE IF EXISTS {full_table_name};')
+
+    sql_lines.append(f'CREATE TABLE {full_table_name} (')
+
+    all_fields = []
+    all_comments = []
+
+    for field in parsed['fields']:
+        field_name = field['name']
+        sql_field_name = camel_to_snake(field_name) if use_camel_to_snake else field_name.lower()
+
+        sql_type, constraints, default_value = java_type_to_sql(field['type'], sql_field_name, db_type)
+
+        field_parts = {
+            'column': sql_field_name,
+            'name': f'"{sql_field_name}"' if db_type == "PostgreSQL" else f"`{sql_field_name}`",
+            'type': sql_type,
+            'constraints': constraints,
+            'default': default_value,
+            'comment': ''
+        }
+        all_fields.append(field_parts)
+
+        if field['comment']:
+            field_parts['comment'] = 'ID' if sql_field_name == 'id' else field['comment']
+            all_comments.append((sql_field_name, field_parts['comment']))
+
+    if add_base_do_fields:
+        for field_name, field_type, comment in BASE_DO_FIELDS:
+            sql_field_name = camel_to_snake(field_name) if use_camel_to_snake else field_name.lower()
+            sql_type, constraints, default_value = java_type_to_sql(field_type, sql_field_name, db_type)
+
+            if not any(f['column'] == sql_field_name for f in all_fields):
+                field_parts = {
+                    'column': sql_field_name,
+                    'name': f'"{sql_field_name}"' if db_type == "PostgreSQL" else f"`{sql_field_name}`",
+                    'type': sql_type,
+                    'constraints': constraints,
+                    'default': default_value,
+                    'comment': comment
+                }
+                all_fields.append(field_parts)
+                all_comments.append((sql_field_name, comment))
+
+    max_name_len = max(len(f['name']) for f in all_fields) if all_fields else 0
+    max_type_len = max(len(f['type']) for f in all_fields) if all_fields else 0
+
+    field_definitions = []
+    for field_parts in all_fields:
+        line = f"    {field_parts['name'].ljust(max_name_len)} {field_parts['type'].ljust(max_type_len)}"
+
+        if field_parts['constraints']:
+            line += f" {field_parts['constraints']}"
+        if field_parts['default']:
+            line += f" {field_parts['default']}"
+        if field_parts['comment'] and db_type != "PostgreSQL":
+            line += f" COMMENT '{_sql_literal(field_parts['comment'])}'"
+
+        field_definitions.append(line.rstrip())
+
+    sql_lines.append(',\n'.join(field_definitions))
+    sql_lines.append(');')
+
+    comment_lines = []
+    if db_type == "PostgreSQL":
+        for sql_field_name, comment_text in all_comments:
+            comment_line = f'COMMENT ON COLUMN {full_table_name}."{sql_field_name}" IS \'{_sql_literal(comment_text)}\';'
+            comment_lines.append(comment_line)
+        if parsed['class_comment']:
+            table_comment = parsed['class_comment']
+            if 'DO' in table_comment:
+                table_comment = table_comment.replace(' DO', '').strip()
+            if not table_comment.endswith('table'):
+                table_comment += ' table'
+            table_comment_line = f'COMMENT ON TABLE {full_table_name} IS \'{_sql_literal(table_comment)}\';'
+            comment_lines.append(table_comment_line)
+    else:
+        if parsed['class_comment']:
+            table_comment = parsed['class_comment']
+            if 'DO' in table_comment:
+                table_comment = table_comment.replace(' DO', '').strip()
+            if not table_comment.endswith('table'):
+                table_comment += ' table'
+            table_comment_line = f'ALTER TABLE `{table_name}` COMMENT = \'{_sql_literal(table_comment)}\';'
+            comment_lines.append(table_comment_line)
+
+    final_sql = '\n'.join(sql_lines)
+    if comment_lines:
+        final_sql += '\n' + '\n'.join(comment_lines)
+
+    if add_sequence and db_type == "PostgreSQL" and parsed['key_sequence']:
+        sequence_name = parsed['key_sequence']
+        final_sql += f'\n\nDROP SEQUENCE IF EXISTS {sequence_name};'
+        final_sql += f'\nCREATE SEQUENCE {sequence_name}\n    START 1;'
+
+    return final_sql
+
+
+_SQL_IDENT = r'(?:"([^"]+)"|`([^`]+)`|(\w+))'
+
+_PG_TYPE_ALIASES = {
+    'bigint': 'int8',
+    'integer': 'int4',
+    'int': 'int4',
+    'smallint': 'int2',
+    'real': 'float4',
+    'float': 'float8',
+    'double precision': 'float8',
+    'character varying': 'varchar',
+    'character': 'char',
+    'decimal': 'numeric',
+    'boolean': 'bool',
+    'timestamp with time zone': 'timestamptz',
+    'timestamp without time zone': 'timestamp',
+    'time with time zone': 'timetz',
+    'time without time zone': 'time',
+}
+
+_MYSQL_TYPE_ALIASES = {
+    'integer': 'int',
+    'numeric': 'decimal',
+    'dec': 'decimal',
+    'bool': 'tinyint',
+    'boolean': 'tinyint',
+}
+
+_COLUMN_CONSTRAINT_SPLIT = re.compile(
+    r'\s+(?=(?:NOT|NULL|DEFAULT|PRIMARY|UNIQUE|CHECK|REFERENCES|COMMENT|COLLATE|'
+    r'CHARACTER\s+SET|AUTO_INCREMENT|GENERATED|CONSTRAINT)\b)', re.I)
+
+_TABLE_CONSTRAINT_KEYWORDS = {'constraint', 'primary', 'unique', 'key', 'index', 'foreign', 'check', 'fulltext'}
+
+
+def _ident(groups: Tuple) -> str:
+    return next((g for g in groups if g), '')
+
+
+def _key(name: str, case_sensitive: bool) -> str:
+    return name if case_sensitive else name.lower()
+
+
+def _table_key(schema: str, table: str, case_sensitive: bool) -> Tuple[str, str]:
+    return _key(schema, case_sensitive), _key(table, case_sensitive)
+
+
+def _lookup_table(index: Dict, schema: str, table: str, case_sensitive: bool):
+    entry = index.get(_table_key(schema, table, case_sensitive))
+    if entry is None and schema:
+        entry = index.get(_table_key('', table, case_sensitive))
+    if entry is None and not schema:
+        matches = [e for (_, t), e in index.items() if t == _key(table, case_sensitive)]
+        entry = matches[0] if len(matches) == 1 else None
+    return entry
+
+
+def _strip_sql_comments(sql_text: str) -> str:
+    return re.sub(
+        r"""('(?:[^']|'')*'|"[^"]*"|`[^`]*`)|--[^\n]*|/\*.*?\*/""",
+        lambda m: m.group(1) or '',
+        sql_text,
+        flags=re.S
+    )
+
+
+def _split_top_level(body: str) -> List[str]:
+    parts = []
+    depth = 0
+    quote = ''
+    start = 0
+    for i, ch in enumerate(body):
+        if quote:
+            if ch == quote:
+                quote = ''
+        elif ch in '"`\'':
+            quote = ch
+        elif ch == '(':
+            depth += 1
+        elif ch == ')':
+            depth -= 1
+        elif ch == ',' and depth == 0:
+            parts.append(body[start:i])
+            start = i + 1
+    parts.append(body[start:])
+    return [p.strip() for p in parts if p.strip()]
+
+
+def _normalize_sql_type(sql_type: str, db_type: str = "PostgreSQL") -> str:
+    t = re.sub(r'\s+', ' ', sql_type.strip().lower().replace('"', ''))
+    t = re.sub(r'\s*\(\s*', '(', t)
+    t = re.sub(r'\s*,\s*', ',', t)
+    t = re.sub(r'\s*\)', ')', t)
+
+    m = re.match(r'([a-z_ ]+?)(\([^)]*\))?( with(?:out)? time zone)?( unsigned)?$', t)
+    if not m:
+        return t
+    base, args, tz, unsigned = m.group(1), m.group(2) or '', m.group(3) or '', m.group(4) or ''
+
+    if db_type == "PostgreSQL":
+        base = _PG_TYPE_ALIASES.get(base + tz, _PG_TYPE_ALIASES.get(base, base))
+        if base in ('int2', 'int4', 'int8'):
+            args = ''
+        elif base in ('timestamp', 'timestamptz', 'time', 'timetz') and args == '(6)':
+            args = ''
+    else:
+        base = _MYSQL_TYPE_ALIASES.get(base, base)
+        if base in ('tinyint', 'smallint', 'mediumint', 'int', 'bigint'):
+            args = ''
+
+    return base + args + unsigned
+
+
+def parse_ddl_index(ddl_text: str, case_sensitive: bool = False) -> Dict:
+    ddl_text = _strip_sql_comments(ddl_text)
+    index = {}
+
+    create_pat = re.compile(
+        rf"""CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?
+        (?:{_SQL_IDENT}\.)?{_SQL_IDENT}\s*\(
+        (.*?)
+        \)((?:[^;()']|'(?:[^']|'')*')*?)
+        (?:;|(?=\s*CREATE\b)|\s*\Z)
+        """, re.S | re.I | re.X)
+
+    for match in create_pat.finditer(ddl_text):
+        schema = _ident(match.group(1, 2, 3))
+        table = _ident(match.group(4, 5, 6))
+        body, tail = match.group(7), match.group(8)
+
+        table_comment = re.search(r"\bCOMMENT\s*=?\s*'((?:[^']|'')*)'", tail, re.I)
+        entry = {
+            'name': table,
+            'schema': schema,
+            'comment': table_comment.group(1).replace("''", "'") if table_comment else '',
+            'columns': {}
+        }
+
+        for chunk in _split_top_level(body):
+            m = re.match(rf'{_SQL_IDENT}\s+(.*)', chunk, re.S)
+            if not m:
+                continue
+            if m.group(3) and m.group(3).lower() in _TABLE_CONSTRAINT_KEYWORDS:
+                continue
+            col_name = _ident(m.group(1, 2, 3))
+            definition = re.sub(r'\s+', ' ', m.group(4).strip())
+            type_and_constraints = _COLUMN_CONSTRAINT_SPLIT.split(definition, 1)
+            col_comment = re.search(r"\bCOMMENT\s+'((?:[^']|'')*)'", definition, re.I)
+            entry['columns'][_key(col_name, case_sensitive)] = {
+                'name': col_name,
+                'type': type_and_constraints[0],
+                'constraints': type_and_constraints[1] if len(type_and_constraints) > 1 else '',
+                'comment': col_comment.group(1).replace("''", "'") if col_comment else ''
+            }
+
+        index[_table_key(schema, table, case_sensitive)] = entry
+
+    comment_pat = re.compile(r"COMMENT\s+ON\s+(TABLE|COLUMN)\s+([^;]+?)\s+IS\s+'((?:[^']|'')*)'\s*;", re.S | re.I)
+    for match in comment_pat.finditer(ddl_text):
+        target, path = match.group(1).upper(), match.group(2)
+        comment = match.group(3).replace("''", "'")
+        parts = [_ident(g) for g in re.findall(_SQL_IDENT, path)]
+        if target == 'COLUMN':
+            parts, column_name = parts[:-1], parts[-1] if parts else ''
+        if not parts:
+            continue
+        schema = parts[-2] if len(parts) >= 2 else ''
+        entry = _lookup_table(index, schema, parts[-1], case_sensitive)
+        if entry is None:
+            continue
+        if target == 'TABLE':
+            entry['comment'] = comment
+        else:
+            column = entry['columns'].get(_key(column_name, case_sensitive))
+            if column is not None:
+                column['comment'] = comment
+
+    return index
+
+
+def _expected_columns(parsed: Dict, add_base_do_fields: bool, use_camel_to_snake: bool,
+                      db_type: str) -> List[Dict]:
+    columns = []
+    seen = set()
+
+    fields = [(f['name'], f['type'], f['comment']) for f in parsed['fields']]
+    if add_base_do_fields:
+        fields += BASE_DO_FIELDS
+
+    for field_name, field_type, comment in fields:
+        sql_field_name = camel_to_snake(field_name) if use_camel_to_snake else field_name.lower()
+        if sql_field_name in seen:
+            continue
+        seen.add(sql_field_name)
+
+        sql_type, constraints, default_value = java_type_to_sql(field_type, sql_field_name, db_type)
+        columns.append({
+            'name': sql_field_name,
+            'type': sql_type,
+            'constraints': constraints,
+            'default': default_value,
+            'comment': 'ID' if comment and sql_field_name == 'id' else comment
+        })
+    return columns
+
+
+def reconcile_java_do(java_code: str, ddl_index: Dict, schema_name: str = "public",
+                      add_base_do_fields: bool = True, add_sequence: bool = True,
+                      use_camel_to_snake: bool = True, db_type: str = "PostgreSQL",
+                      case_sensitive: bool = False) -> List[Dict]:
+    parsed = parse_java_class(java_code)
+
+    if not parsed['class_name']:
+        return [{'table': '', 'column': '', 'issue': 'parse_error',
+                 'expected': '', 'actual': '', 'alter_sql': '-- Error: Could not parse Java class'}]
+
+    table_schema, table_name = _resolve_table_name(parsed, schema_name)
+    entry = _lookup_table(ddl_index, table_schema, table_name, case_sensitive)
+
+    if entry is None:
+        create_sql = java_do_to_sql(java_code, table_schema, False, add_base_do_fields,
+                                    add_sequence, use_camel_to_snake, db_type)
+        display_name = f'{table_schema}.{table_name}' if db_type == "PostgreSQL" else table_name
+        return [{'table': display_name, 'column': '', 'issue': 'missing_table',
+                 'expected': parsed['class_name'], 'actual': '', 'alter_sql': create_sql}]
+
+    if db_type == "PostgreSQL":
+        full_table_name = f'"{entry["schema"] or table_schema}"."{entry["name"]}"'
+    else:
+        full_table_name = f"`{entry['name']}`"
+    display_name = f'{entry["schema"]}.{entry["name"]}' if entry['schema'] else entry['name']
+
+    drift = []
+    for column in _expected_columns(parsed, add_base_do_fields, use_camel_to_snake, db_type):
+        col_name = column['name']
+        quoted = f'"{col_name}"' if db_type == "PostgreSQL" else f"`{col_name}`"
+        comment = _sql_literal(column['comment'])
+        definition = ' '.join(p for p in (column['type'], column['constraints'], column['default']) if p)
+        actual = entry['columns'].get(_key(col_name, case_sensitive))
+
+        if actual is None:
+            alter = ''
+            add_definition = definition
+            if column['constraints'] and not column['default']:
+                alter = (f'-- NOTE: {quoted} is "{column["constraints"]}" in the DO; '
+                         f'backfill existing rows before adding the constraint\n')
+                add_definition = column['type']
+            alter += f'ALTER TABLE {full_table_name} ADD COLUMN {quoted} {add_definition}'
+            if comment and db_type == "PostgreSQL":
+                alter += f';\nCOMMENT ON COLUMN {full_table_name}.{quoted} IS \'{comment}\';'
+            elif comment:
+                alter += f' COMMENT \'{comment}\';'
+            else:
+                alter += ';'
+            drift.append({'table': display_name, 'column': col_name, 'issue': 'missing_column',
+                          'expected': definition, 'actual': '', 'alter_sql': alter})
+            continue
+
+        type_mismatch = _normalize_sql_type(column['type'], db_type) != _normalize_sql_type(actual['type'], db_type)
+        missing_comment = bool(column['comment']) and not actual['comment']
+
+        if db_type == "PostgreSQL":
+            # Casts such as varchar -> int8 need an explicit USING; bool has no
+            # direct cast to int2, so it goes through int4 first.
+            source = f'{quoted}::int4' if _normalize_sql_type(actual['type']) == 'bool' else quoted
+            type_alter = (f'ALTER TABLE {full_table_name} ALTER COLUMN {quoted} TYPE {column["type"]} '
+                          f'USING {source}::{column["type"]};')
+            comment_alter = f'COMMENT ON COLUMN {full_table_name}.{quoted} IS \'{comment}\';'
+        else:
+            # MODIFY redefines the whole column, so keep the live constraints and
+            # fold the type and comment fixes into a single statement.
+            new_type = column['type'] if type_mismatch else actual['type']
+            constraints = actual['constraints']
+            if type_mismatch:
+                constraints = re.sub(r'\s*\b(?:CHARACTER\s+SET|COLLATE)\s+\w+', '', constraints, flags=re.I).strip()
+            if missing_comment:
+                constraints = re.sub(r"\s*\bCOMMENT\s+'(?:[^']|'')*'", '', constraints, flags=re.I).strip()
+                constraints = f"{constraints} COMMENT '{comment}'".strip()
+            type_alter = f'ALTER TABLE {full_table_name} MODIFY COLUMN {quoted} {new_type} {constraints}'.rstrip() + ';'
+            comment_alter = '' if type_mismatch else type_alter
+
+        if type_mismatch:
+            drift.append({'table': display_name, 'column': col_name, 'issue': 'type_mismatch',
+                          'expected': column['type'], 'actual': actual['type'], 'alter_sql': type_alter})
+        if missing_comment:
+            drift.append({'table': display_name, 'column': col_name, 'issue': 'missing_comment',
+                          'expected': column['comment'], 'actual': '', 'alter_sql': comment_alter})
+
+    if parsed['class_comment'] and not entry['comment']:
+        table_comment = parsed['class_comment']
+        if 'DO' in table_comment:
+            table_comment = table_comment.replace(' DO', '').strip()
+        if not table_comment.endswith('table'):
+            table_comment += ' table'
+        if db_type == "PostgreSQL":
+            alter = f'COMMENT ON TABLE {full_table_name} IS \'{_sql_literal(table_comment)}\';'
+        else:
+            alter = f'ALTER TABLE {full_table_name} COMMENT = \'{_sql_literal(table_comment)}\';'
+        drift.append({'table': display_name, 'column': '', 'issue': 'missing_comment',
+                      'expected': table_comment, 'actual': '', 'alter_sql': alter})
+
+    return drift
+
+
+def format_drift_report(drift: List[Dict]) -> str:
+    report = "--- Schema Drift Report ---\n"
+    current_table = None
+    for row in drift:
+        if row['table'] != current_table:
+            current_table = row['table']
+            report += f"\nTable: {current_table or '(unknown)'}\n"
+        target = row['column'] or '(table)'
+        report += f"  - {row['issue']}: {target}"
+        if row['expected'] or row['actual']:
+            report += f" (expected: {row['expected'] or '-'}, actual: {row['actual'] or '-'})"
+        report += "\n"
+    return report
+
+
+def get_stats(sql: str) -> dict:
+    lines = sql.splitlines()
+    return {
+        'total': len(lines),
+        'non_empty': len([l for l in lines if l.strip()]),
+        'comments': len([l for l in lines if
+                         l.strip().startswith('--') or l.strip().startswith('COMMENT') or l.strip().startswith(
+                             'ALTER TABLE')]),
+        'fields': sql.upper().count('NOT NULL') + sql.upper().count('DEFAULT')
+    }
@@ -0,0 +1,239 @@
+import pytest
+
+from sql_tools import (
+    _normalize_sql_type,
+    format_drift_report,
+    java_do_to_sql,
+    parse_ddl_index,
+    reconcile_java_do,
+)
+
+PG_DUMP = """
+--
+-- Name: sys_user; Type: TABLE; Schema: public; Owner: postgres
+--
+CREATE TABLE public.sys_user (
+    id bigint NOT NULL,
+    user_name character varying(255) COLLATE pg_catalog."default" NOT NULL,
+    amount numeric(10, 2),
+    active boolean,
+    create_time timestamp(6) without time zone DEFAULT CURRENT_TIMESTAMP NOT NULL,
+    CONSTRAINT sys_user_pkey PRIMARY KEY (id)
+);
+
+COMMENT ON TABLE public.sys_user IS 'User table';
+COMMENT ON COLUMN public.sys_user.id IS 'ID';
+
+CREATE TABLE other.sys_user (
+    id integer
+);
+"""
+
+MYSQL_DUMP = """
+/*!40101 SET NAMES utf8mb4 */;
+DROP TABLE IF EXISTS `orders`;
+CREATE TABLE `orders` (
+  `id` bigint(20) NOT NULL AUTO_INCREMENT COMMENT 'ID',
+  `status` varchar(10) CHARACTER SET utf8mb4 NOT NULL DEFAULT '0',
+  `tenant_id` bigint NOT NULL DEFAULT '0' COMMENT '',
+  `total` decimal(10,2) DEFAULT NULL COMMENT 'Total (incl. tax)',
+  PRIMARY KEY (`id`),
+  KEY `idx_status` (`status`)
+) ENGINE=InnoDB AUTO_INCREMENT=3 DEFAULT CHARSET=utf8mb4 COMMENT='Orders';
+"""
+
+
+def _issues(drift):
+    return {(row['column'], row['issue']): row for row in drift}
+
+
+def test_parse_pg_dump():
+    index = parse_ddl_index(PG_DUMP)
+
+    assert set(index) == {('public', 'sys_user'), ('other', 'sys_user')}
+    user = index[('public', 'sys_user')]
+    assert user['comment'] == 'User table'
+    assert list(user['columns']) == ['id', 'user_name', 'amount', 'active', 'create_time']
+    assert user['columns']['id']['comment'] == 'ID'
+    assert user['columns']['user_name']['type'] == 'character varying(255)'
+    assert user['columns']['amount']['type'] == 'numeric(10, 2)'
+    assert user['columns']['create_time']['constraints'] == 'DEFAULT CURRENT_TIMESTAMP NOT NULL'
+    assert index[('other', 'sys_user')]['comment'] == ''
+
+
+def test_parse_mysql_dump():
+    index = parse_ddl_index(MYSQL_DUMP)
+
+    orders = index[('', 'orders')]
+    assert orders['comment'] == 'Orders'
+    assert list(orders['columns']) == ['id', 'status', 'tenant_id', 'total']
+    assert orders['columns']['id'] == {
+        'name': 'id',
+        'type': 'bigint(20)',
+        'constraints': "NOT NULL AUTO_INCREMENT COMMENT 'ID'",
+        'comment': 'ID',
+    }
+    assert orders['columns']['total']['comment'] == 'Total (incl. tax)'
+
+
+def test_parse_without_semicolon_and_with_line_comments():
+    index = parse_ddl_index(
+        "CREATE TABLE a (\n id bigint\n)\n\n"
+        "CREATE TABLE b (\n id bigint, -- the id, (pk)\n name varchar(20) /* x, y */,\n code varchar(5)\n);"
+    )
+
+    assert index[('', 'a')]['columns']['id']['type'] == 'bigint'
+    assert list(index[('', 'b')]['columns']) == ['id', 'name', 'code']
+
+
+def test_comment_on_schema_fallback():
+    index = parse_ddl_index(
+        'CREATE TABLE "public"."user" ("id" int8);\n'
+        "COMMENT ON TABLE user IS 'Users';\n"
+        'CREATE TABLE account (id int8);\n'
+        "COMMENT ON COLUMN public.account.id IS 'ID';"
+    )
+
+    assert index[('public', 'user')]['comment'] == 'Users'
+    assert index[('', 'account')]['columns']['id']['comment'] == 'ID'
+
+
+@pytest.mark.parametrize('left, right', [
+    ('bigint', 'int8'),
+    ('integer', 'int4'),
+    ('character varying(255)', 'varchar(255)'),
+    ('numeric(10, 2)', 'decimal(10,2)'),
+    ('timestamp(6) without time zone', 'timestamp'),
+    ('timestamp with time zone', 'timestamptz'),
+    ('double precision', 'float'),
+])
+def test_normalize_pg_aliases(left, right):
+    assert _normalize_sql_type(left) == _normalize_sql_type(right)
+
+
+@pytest.mark.parametrize('left, right', [
+    ('bigint(20)', 'BIGINT'),
+    ('int(11)', 'INT'),
+    ('tinyint(1)', 'TINYINT(1)'),
+    ('numeric(10,2)', 'DECIMAL(10,2)'),
+])
+def test_normalize_mysql_aliases(left, right):
+    assert _normalize_sql_type(left, 'MySQL') == _normalize_sql_type(right, 'MySQL')
+
+
+@pytest.mark.parametrize('left, right, db_type', [
+    ('datetime', 'TIMESTAMP', 'MySQL'),
+    ('smallint', 'TINYINT(1)', 'MySQL'),
+    ('float4', 'float', 'PostgreSQL'),
+    ('timestamp(3)', 'timestamp(6)', 'PostgreSQL'),
+])
+def test_normalize_keeps_distinct_types(left, right, db_type):
+    assert _normalize_sql_type(left, db_type) != _normalize_sql_type(right, db_type)
+
+
+def test_reconcile_pg_drift():
+    java = '''
+/** User DO */
+@TableName("sys_user")
+public class SysUserDO {
+    /** id */
+    private Long id;
+    /** O'Brien name */
+    private String userName;
+    /** amount */
+    private BigDecimal amount;
+    /** active */
+    private Integer active;
+    /** email */
+    private String email;
+    /** code */
+    private String code;
+}
+'''
+    drift = _issues(reconcile_java_do(java, parse_ddl_index(PG_DUMP), add_base_do_fields=False))
+
+    assert set(drift) == {
+        ('user_name', 'missing_comment'),
+        ('amount', 'missing_comment'),
+        ('active', 'type_mismatch'),
+        ('active', 'missing_comment'),
+        ('email', 'missing_column'),
+        ('code', 'missing_column'),
+    }
+    assert drift[('user_name', 'missing_comment')]['alter_sql'] == \
+        'COMMENT ON COLUMN "public"."sys_user"."user_name" IS \'O\'\'Brien name\';'
+    assert drift[('active', 'type_mismatch')]['alter_sql'] == \
+        'ALTER TABLE "public"."sys_user" ALTER COLUMN "active" TYPE int4 USING "active"::int4::int4;'
+    assert drift[('email', 'missing_column')]['alter_sql'] == (
+        'ALTER TABLE "public"."sys_user" ADD COLUMN "email" varchar(100);\n'
+        'COMMENT ON COLUMN "public"."sys_user"."email" IS \'email\';'
+    )
+    assert drift[('code', 'missing_column')]['alter_sql'].startswith('-- NOTE: "code" is "NOT NULL"')
+    assert 'ADD COLUMN "code" varchar(100);' in drift[('code', 'missing_column')]['alter_sql']
+
+
+def test_reconcile_uses_selected_schema():
+    java = '@TableName("sys_user")\npublic class SysUserDO {\n    private Long id;\n}'
+    index = parse_ddl_index(PG_DUMP)
+
+    assert reconcile_java_do(java, index, add_base_do_fields=False) == []
+    drift = reconcile_java_do(java, index, schema_name='other', add_base_do_fields=False)
+    assert [(row['table'], row['issue']) for row in drift] == [('other.sys_user', 'type_mismatch')]
+    assert drift[0]['alter_sql'].startswith('ALTER TABLE "other"."sys_user"')
+
+
+def test_reconcile_mysql_modify_keeps_constraints():
+    java = '''
+@TableName("orders")
+public class OrdersDO {
+    /** Status */
+    private Integer status;
+    /** Total */
+    private BigDecimal total;
+}
+'''
+    drift = reconcile_java_do(java, parse_ddl_index(MYSQL_DUMP), db_type='MySQL')
+    issues = _issues(drift)
+
+    assert issues[('status', 'type_mismatch')]['alter_sql'] == \
+        "ALTER TABLE `orders` MODIFY COLUMN `status` INT NOT NULL DEFAULT '0' COMMENT 'Status';"
+    assert issues[('status', 'missing_comment')]['alter_sql'] == ''
+    assert issues[('tenant_id', 'missing_comment')]['alter_sql'] == \
+        "ALTER TABLE `orders` MODIFY COLUMN `tenant_id` bigint NOT NULL DEFAULT '0' COMMENT 'Tenant ID';"
+    assert ('total', 'type_mismatch') not in issues
+    assert ('creator', 'missing_column') in issues
+
+
+def test_reconcile_missing_table():
+    java = '''
+@TableName("sys.user")
+public class UserDO {
+    /** id */
+    private Long id;
+    /** creator */
+    private String creator;
+}
+'''
+    pg = reconcile_java_do(java, {})
+    assert [(row['table'], row['issue']) for row in pg] == [('sys.user', 'missing_table')]
+    assert 'CREATE TABLE "sys"."user" (' in pg[0]['alter_sql']
+    assert 'COMMENT ON COLUMN "sys"."user"."id" IS \'ID\';' in pg[0]['alter_sql']
+
+    mysql = reconcile_java_do(java, {}, db_type='MySQL')[0]['alter_sql']
+    assert 'CREATE TABLE `user` (' in mysql
+    assert mysql.count('`creator`') == 1
+    assert 'MODIFY COLUMN' not in mysql
+    assert "AUTO_INCREMENT PRIMARY KEY COMMENT 'ID'" in mysql
+
+
+def test_java_do_to_sql_mysql_dedupes_base_fields():
+    sql = java_do_to_sql('public class UserDO {\n    private Boolean deleted;\n}', db_type='MySQL')
+
+    assert sql.count('`deleted`') == 1
+
+
+def test_reconcile_parse_error_and_report():
+    drift = reconcile_java_do('not java', {})
+
+    assert drift[0]['issue'] == 'parse_error'
+    assert 'parse_error: (table)' in format_drift_report(drift)